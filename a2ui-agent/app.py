@@ -10,23 +10,28 @@ Security:
 - Request body size limits (1 MB)
 """
 
+import hmac
+import json
 import logging
 import os
-from typing import Any, List, Optional
-
-import json as _json
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, List, Literal, Optional
 
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_validator
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
 from content_styles import get_available_styles
-from data_sources import get_available_sources
+from data_sources import close_sources, get_available_sources, load_sources
 from llm_providers import llm_service, provide_location
 
 logger = logging.getLogger(__name__)
@@ -34,29 +39,50 @@ logger = logging.getLogger(__name__)
 
 # ── Configuration ──────────────────────────────────────────────
 
-ALLOWED_ORIGINS = [
-    o.strip() for o in
-    os.getenv(
-        "A2UI_CORS_ORIGINS",
-        "http://localhost:4200,http://localhost:5174,http://localhost:5173,http://localhost:3000",
-    ).split(",")
-]
+ALLOWED_ORIGINS = frozenset(
+    origin for origin in (
+        o.strip() for o in
+        os.getenv(
+            "A2UI_CORS_ORIGINS",
+            "http://localhost:4200,http://localhost:5174,http://localhost:5173,http://localhost:3000",
+        ).split(",")
+    )
+    if origin                                 # ignore stray/trailing commas
+)
 
 API_KEY = os.getenv("A2UI_API_KEY")          # set to require auth; unset = open
+_API_KEY_BYTES = API_KEY.encode() if API_KEY else b""
+_AUTH_ENABLED = bool(API_KEY)
 MAX_BODY_BYTES = 1_000_000                    # 1 MB
 DEBUG = os.getenv("A2UI_DEBUG", "false").lower() == "true"
 
 
 # ── App Setup ──────────────────────────────────────────────────
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the data source registry before serving, off the event loop
+    await load_sources()
+    yield
+    # Close data source connection pools on shutdown
+    await close_sources()
+
+
 app = FastAPI(
     title="A2UI API",
     docs_url="/api/docs" if DEBUG else None,   # hide docs in prod
     redoc_url=None,
+    lifespan=lifespan,
 )
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Rate limiter — in-process fixed-window counters.  Cheaper per call than
+# moving-window, at the cost of allowing a burst of up to 2× the limit
+# across a window boundary.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri="memory://",
+    strategy="fixed-window",
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -70,46 +96,87 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def security_middleware(request: Request, call_next):
-    """Combined security middleware: body-size check, auth, and response headers."""
+# Security response headers, pre-encoded in ASGI wire format.
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"camera=(), microphone=(), geolocation=()"),
+)
 
-    # ── Request body size limit ────────────────────────────────
-    content_length = request.headers.get("content-length")
-    if content_length and int(content_length) > MAX_BODY_BYTES:
-        return JSONResponse(
-            content={"error": "Request body too large"},
-            status_code=413,
-        )
+# Rejections are immutable, so each is built once and replayed.
+_TOO_LARGE = Response(
+    content=orjson.dumps({"error": "Request body too large"}),
+    status_code=413,
+    media_type="application/json",
+)
+_UNAUTHORIZED = Response(
+    content=orjson.dumps({"error": "Unauthorized"}),
+    status_code=401,
+    media_type="application/json",
+)
+
+
+def _header(scope: Scope, name: bytes) -> Optional[bytes]:
+    """First raw value of header *name* (lowercase) in the ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
 
-    # ── Optional API-key auth ──────────────────────────────────
-    if (
-        API_KEY
-        and request.url.path.startswith("/api/")
-        and request.method != "OPTIONS"        # let CORS preflight through
-    ):
-        provided = request.headers.get("X-API-Key")
-        if provided != API_KEY:
-            return JSONResponse(
-                content={"error": "Unauthorized"},
-                status_code=401,
-            )
 
-    response = await call_next(request)
+class SecurityMiddleware:
+    """Body-size limit, optional API-key auth and security headers.
+
+    Written as raw ASGI rather than ``@app.middleware("http")`` so requests
+    skip BaseHTTPMiddleware's task group and body streaming.  Checks read
+    the raw scope headers directly, and security headers are spliced into
+    the ``http.response.start`` message without a ``MutableHeaders`` view.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    # ── Security response headers ──────────────────────────────
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-    response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=()"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    return response
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        # ── Request body size limit ────────────────────────────
+        content_length = _header(scope, b"content-length")
+        if content_length and int(content_length) > MAX_BODY_BYTES:
+            await _TOO_LARGE(scope, receive, send_with_headers)
+            return
+
+        # ── Optional API-key auth ──────────────────────────────
+        if (
+            _AUTH_ENABLED
+            and scope["path"].startswith("/api/")
+            and scope["method"] != "OPTIONS"       # let CORS preflight through
+        ):
+            provided = _header(scope, b"x-api-key") or b""
+            # Constant-time compare — `!=` leaks the matching prefix length.
+            if not hmac.compare_digest(provided, _API_KEY_BYTES):
+                await _UNAUTHORIZED(scope, receive, send_with_headers)
+                return
+
+        await self.app(scope, receive, send_with_headers)
+
+
+# Registered after CORS so it is outermost — rejections and CORS
+# preflights get the security headers too.
+app.add_middleware(SecurityMiddleware)
 
 
 # ── Request Models ─────────────────────────────────────────────
 
 class HistoryMessage(BaseModel):
-    role: str = Field(..., pattern=r"^(user|assistant)$")
+    role: Literal["user", "assistant"]
     content: str = Field(..., max_length=10_000)
 
 
@@ -126,15 +193,20 @@ class DataContextItem(BaseModel):
     data: Any = None
 
 
-VALID_CONTENT_STYLES = {"auto", "analytical", "content", "comparison", "dashboard", "howto", "quick"}
-VALID_PERFORMANCE_MODES = {"auto", "comprehensive", "optimized"}
+# Enumerated as Literal types so pydantic-core validates them natively
+# instead of calling back into Python field validators.
+ContentStyle = Literal["auto", "analytical", "content", "comparison", "dashboard", "howto", "quick"]
+PerformanceMode = Literal["auto", "comprehensive", "optimized"]
 
 
 class ChatRequest(BaseModel):
     message: str = Field(..., min_length=1, max_length=10_000)
     provider: Optional[str] = Field(None, max_length=50, pattern=r"^[a-zA-Z0-9_\-]+$")
     model: Optional[str] = Field(None, max_length=100, pattern=r"^[a-zA-Z0-9_\.\-]+$")
-    history: List[HistoryMessage] = Field(default_factory=list)
+    # max_length is enforced inside pydantic-core as items are consumed,
+    # so an oversized history fails fast instead of being fully validated
+    # before a Python-level length check.
+    history: List[HistoryMessage] = Field(default_factory=list, max_length=50)
     enableWebSearch: bool = True
     enableGeolocation: bool = True
     enableDataSources: bool = True
@@ -143,24 +215,11 @@ class ChatRequest(BaseModel):
         default=None,
         description="Pre-fetched external data injected into the pipeline (passive mode)",
     )
-    contentStyle: str = Field(
-        default="auto",
-        max_length=30,
-    )
-    performanceMode: str = Field(
-        default="auto",
-        max_length=30,
-    )
+    contentStyle: ContentStyle = "auto"
+    performanceMode: PerformanceMode = "auto"
     smartRouting: bool = True
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
 
-    @field_validator("history")
-    @classmethod
-    def limit_history(cls, v):
-        if len(v) > 50:
-            raise ValueError("History exceeds maximum of 50 messages")
-        return v
-
     @field_validator("dataContext")
     @classmethod
     def limit_data_context(cls, v):
@@ -168,65 +227,117 @@ class ChatRequest(BaseModel):
             raise ValueError("dataContext exceeds maximum of 10 sources")
         return v
 
-    @field_validator("contentStyle")
-    @classmethod
-    def validate_content_style(cls, v):
-        if v not in VALID_CONTENT_STYLES:
-            raise ValueError(f"Invalid contentStyle: {v}")
-        return v
 
-    @field_validator("performanceMode")
-    @classmethod
-    def validate_performance_mode(cls, v):
-        if v not in VALID_PERFORMANCE_MODES:
-            raise ValueError(f"Invalid performanceMode: {v}")
-        return v
+# ── Routes ─────────────────────────────────────────────────────
 
+# Static payloads are serialized once at import instead of per request.
+_HOME_BODY = orjson.dumps({"message": "Welcome to the A2UI Python Backend!"})
 
-# ── Routes ─────────────────────────────────────────────────────
+# Discovery payloads only change when env vars or config change, so they
+# are serialized once and re-built at most every _PAYLOAD_TTL seconds
+# (keyed on a monotonic time bucket) to pick up key rotation.
+_PAYLOAD_TTL = 60
+
+
+def _ttl_bucket() -> int:
+    return int(time.monotonic() // _PAYLOAD_TTL)
+
+
+@lru_cache(maxsize=1)
+def _styles_body() -> bytes:
+    return orjson.dumps({"styles": get_available_styles()})
+
+
+@lru_cache(maxsize=1)
+def _providers_body(bucket: int) -> bytes:
+    return orjson.dumps({"providers": llm_service.get_available_providers()})
 
+
+@lru_cache(maxsize=1)
+def _tools_body(bucket: int) -> bytes:
+    return orjson.dumps({"tools": llm_service.get_tool_states()})
+
+
+@lru_cache(maxsize=1)
+def _sources_body(bucket: int) -> bytes:
+    return orjson.dumps({"sources": get_available_sources()})
+
+
+# /api and /api/styles serve static pre-serialized bytes, so they are not
+# rate limited — the limiter bookkeeping would cost more than the response.
 @app.get("/api")
-@limiter.limit("60/minute")
-def home(request: Request):
-    return JSONResponse(content={"message": "Welcome to the A2UI Python Backend!"})
+async def home(request: Request):
+    return Response(content=_HOME_BODY, media_type="application/json")
 
 
 @app.get("/api/providers")
 @limiter.limit("60/minute")
-def get_providers(request: Request):
+async def get_providers(request: Request):
     """
     Get available LLM providers and their models.
 
     Returns providers that have valid API keys configured.
     """
-    providers = llm_service.get_available_providers()
-    return JSONResponse(content={"providers": providers})
+    return Response(content=_providers_body(_ttl_bucket()), media_type="application/json")
 
 
 @app.get("/api/styles")
-@limiter.limit("60/minute")
-def get_styles(request: Request):
+async def get_styles(request: Request):
     """Return available content styles for the frontend."""
-    return JSONResponse(content={"styles": get_available_styles()})
+    return Response(content=_styles_body(), media_type="application/json")
 
 
 @app.get("/api/tools")
 @limiter.limit("60/minute")
-def get_tools(request: Request):
+async def get_tools(request: Request):
     """Return configurable tools and their current state.
 
     Each tool reports its default, whether it's locked by an env
     variable, and the effective env override value (if any).
     The frontend uses this to disable toggles for locked tools.
     """
-    return JSONResponse(content={"tools": llm_service.get_tool_states()})
+    return Response(content=_tools_body(_ttl_bucket()), media_type="application/json")
 
 
 @app.get("/api/data-sources")
 @limiter.limit("60/minute")
-def get_data_sources(request: Request):
+async def get_data_sources(request: Request):
     """Return configured data sources and their availability."""
-    return JSONResponse(content={"sources": get_available_sources()})
+    return Response(content=_sources_body(_ttl_bucket()), media_type="application/json")
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize with orjson, falling back to stdlib on rejection.
+
+    orjson rejects integers beyond 64 bits, which LLM output can contain,
+    so those still serialize instead of failing the response.
+    """
+    try:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(content, default=str, ensure_ascii=False).encode()
+
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Encode *content* into a JSON ``Response``."""
+    return Response(
+        content=_dumps(content),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+# SSE framing for the event types generate_stream emits, pre-encoded so
+# each event is a single bytes concat with no str round-trip.
+_SSE_PREFIXES = {
+    etype: f"event: {etype}\ndata: ".encode()
+    for etype in ("step", "token", "need_location", "complete", "error", "message")
+}
+_SSE_ERROR_EVENT = (
+    _SSE_PREFIXES["error"]
+    + orjson.dumps({"message": "Something went wrong. Please try again."})
+    + b"\n\n"
+)
 
 
 # A2UI Chat endpoint — returns structured A2UI responses
@@ -242,31 +353,37 @@ async def chat(request: Request, body: ChatRequest):
     by a ``complete`` event containing the full A2UI response.  Otherwise
     returns a standard JSON response.
     """
-    if not body.message.strip():
-        return JSONResponse(
-            content={"error": "Message is required"},
-            status_code=400,
-        )
+    message = body.message.strip()
+    if not message:
+        return _json_response({"error": "Message is required"}, status_code=400)
 
     if not (body.provider and body.model):
-        return JSONResponse(
-            content={"error": "No LLM provider selected. Choose a provider and model from the dropdown."},
+        return _json_response(
+            {"error": "No LLM provider selected. Choose a provider and model from the dropdown."},
             status_code=400,
         )
 
-    history_dicts = [h.model_dump() for h in body.history]
-    location_dict = body.userLocation.model_dump() if body.userLocation else None
+    # Flat, already-validated models — read attributes directly rather than
+    # running each item through Pydantic's serializer.
+    history_dicts = [{"role": h.role, "content": h.content} for h in body.history]
+    loc = body.userLocation
+    location_dict = {"lat": loc.lat, "lng": loc.lng, "label": loc.label} if loc else None
     data_context_dicts = (
-        [dc.model_dump() for dc in body.dataContext] if body.dataContext else None
+        [{"source": dc.source, "label": dc.label, "data": dc.data} for dc in body.dataContext]
+        if body.dataContext else None
+    )
+    # ASGI servers deliver header names lowercased; scan the raw pairs
+    # rather than building Starlette's case-insensitive Headers view.
+    wants_sse = any(
+        k == b"accept" and b"text/event-stream" in v
+        for k, v in request.scope["headers"]
     )
-    accept = request.headers.get("accept", "")
-    wants_sse = "text/event-stream" in accept
 
     if wants_sse:
         async def _sse_generator():
             try:
                 async for event in llm_service.generate_stream(
-                    body.message,
+                    message,
                     body.provider,
                     body.model,
                     history=history_dicts,
@@ -281,12 +398,13 @@ async def chat(request: Request, body: ChatRequest):
                     temperature=body.temperature,
                 ):
                     etype = event.get("event", "message")
-                    payload = _json.dumps(event.get("data", {}), default=str)
-                    yield f"event: {etype}\ndata: {payload}\n\n"
+                    prefix = _SSE_PREFIXES.get(etype)
+                    if prefix is None:
+                        prefix = f"event: {etype}\ndata: ".encode()
+                    yield prefix + _dumps(event.get("data", {})) + b"\n\n"
             except Exception as exc:
                 logger.exception("SSE stream error")
-                err = _json.dumps({"message": "Something went wrong. Please try again."})
-                yield f"event: error\ndata: {err}\n\n"
+                yield _SSE_ERROR_EVENT
 
         return StreamingResponse(
             _sse_generator(),
@@ -301,7 +419,7 @@ async def chat(request: Request, body: ChatRequest):
     # Non-streaming JSON response (backward compatible)
     try:
         response = await llm_service.generate(
-            body.message,
+            message,
             body.provider,
             body.model,
             history=history_dicts,
@@ -314,13 +432,13 @@ async def chat(request: Request, body: ChatRequest):
             enable_data_sources=body.enableDataSources,
             data_context=data_context_dicts,
         )
-        return JSONResponse(content=response)
+        return _json_response(response)
     except ValueError as e:
-        return JSONResponse(content={"error": str(e)}, status_code=400)
+        return _json_response({"error": str(e)}, status_code=400)
     except Exception as e:
         logger.exception("LLM error")
-        return JSONResponse(
-            content={
+        return _json_response(
+            {
                 "text": "Something went wrong generating a response. Please try again.",
                 "_error": str(e),
             },
@@ -337,8 +455,8 @@ async def handle_provide_location(request: Request, request_id: str, body: UserL
     The frontend resolves the browser Geolocation API and POSTs the
     result here so the pipeline can resume with location context.
     """
-    provide_location(request_id, body.model_dump())
-    return JSONResponse(content={"ok": True})
+    provide_location(request_id, {"lat": body.lat, "lng": body.lng, "label": body.label})
+    return _json_response({"ok": True})
 
 
 if __name__ == "__main__":
@@ -346,9 +464,14 @@ if __name__ == "__main__":
         level=logging.INFO,
         format="%(levelname)s %(name)s: %(message)s",
     )
+    # uvloop/httptools are used when installed (uvicorn[standard]).
+    # Workers default to 1: the rate limiter and the pending-location
+    # handshake live in process memory, so with several workers a
+    # provide-location POST can land on a process that isn't waiting.
     uvicorn.run(
         "app:app",
         host="127.0.0.1",
         port=8000,
         reload=DEBUG,
+        workers=None if DEBUG else int(os.getenv("A2UI_WORKERS", "1")),
     )
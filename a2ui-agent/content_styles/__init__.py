@@ -8,7 +8,10 @@ Public API
 ----------
 - ``classify_style(message)``      → style ID ("analytical", "content", …)
 - ``get_system_prompt(style_id)``  → composed prompt (base + style-specific)
+- ``get_system_prompt_size(style_id)`` → UTF-8 byte size of that prompt
+- ``split_cacheable_prefix(prompt)`` → (static style prompt, appended context)
 - ``get_component_priority(style_id)`` → ordered list of component types
+- ``get_component_ranks(style_id)`` → {component type: rank} for ordering
 - ``get_available_styles()``       → list of style metadata dicts
 - ``CONTENT_STYLES``               → full registry dict
 
@@ -22,7 +25,8 @@ is the hard ceiling.  Both can be overridden by the caller.
 import logging
 import re
 from datetime import date
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from ._base import BASE_RULES
 from .analytical import STYLE as _analytical
@@ -59,6 +63,7 @@ def _compose_prompt(style_id: str) -> str:
 
 # Pre-compose and validate all styles at import time
 _COMPOSED_PROMPTS: Dict[str, str] = {}
+_COMPOSED_PROMPT_BYTES: Dict[str, int] = {}
 for _sid in CONTENT_STYLES:
     _prompt = _compose_prompt(_sid)
     _size = len(_prompt.encode("utf-8"))
@@ -73,6 +78,51 @@ for _sid in CONTENT_STYLES:
             _sid, _size, DEFAULT_MAX_PROMPT_BYTES,
         )
     _COMPOSED_PROMPTS[_sid] = _prompt
+    _COMPOSED_PROMPT_BYTES[_sid] = _size
+
+
+# Component type → position in each style's priority list (first wins).
+_COMPONENT_RANKS: Dict[str, Dict[str, int]] = {}
+for _sid, _style in CONTENT_STYLES.items():
+    _ranks: Dict[str, int] = {}
+    for _ctype in _style["component_priority"]:
+        _ranks.setdefault(_ctype, len(_ranks))
+    _COMPONENT_RANKS[_sid] = _ranks
+
+
+# Dated prompts (style prompt + date line), rebuilt at most once per style per day.
+# Maps style_id → (date ordinal, full prompt, UTF-8 byte size).
+_DATED_PROMPTS: Dict[str, Tuple[int, str, int]] = {}
+
+
+def _resolve_style(style_id: str) -> str:
+    if style_id in _COMPOSED_PROMPTS:
+        return style_id
+    logger.warning("Unknown style '%s' — falling back to '%s'", style_id, DEFAULT_STYLE)
+    return DEFAULT_STYLE
+
+
+def _dated_prompt(style_id: str) -> Tuple[int, str, int]:
+    """Return the cached ``(ordinal, prompt, size)`` entry for a known style."""
+    today = date.today()
+    ordinal = today.toordinal()
+    cached = _DATED_PROMPTS.get(style_id)
+    if cached is not None and cached[0] == ordinal:
+        return cached
+
+    # The date goes after the static prompt so that prefix stays
+    # byte-identical across days for provider prompt caching.
+    footer = (
+        f"\n\nCurrent date: {today.strftime('%B %d, %Y')}. All responses must be relevant "
+        f"to this date unless the user specifies otherwise."
+    )
+    entry = (
+        ordinal,
+        _COMPOSED_PROMPTS[style_id] + footer,
+        _COMPOSED_PROMPT_BYTES[style_id] + len(footer.encode("utf-8")),
+    )
+    _DATED_PROMPTS[style_id] = entry
+    return entry
 
 
 # ── Public API ────────────────────────────────────────────────
@@ -81,25 +131,45 @@ for _sid in CONTENT_STYLES:
 def get_system_prompt(style_id: str, max_bytes: Optional[int] = None) -> str:
     """Return the full system prompt for a content style.
 
-    Prepends today's date (matches original behavior).
+    Appends today's date after the static base + style prompt.
     If *max_bytes* is given, the raw prompt (without date) is checked
     against that limit and a warning is logged if exceeded.
     """
-    prompt = _COMPOSED_PROMPTS.get(style_id)
-    if prompt is None:
-        logger.warning("Unknown style '%s' — falling back to '%s'", style_id, DEFAULT_STYLE)
-        prompt = _COMPOSED_PROMPTS[DEFAULT_STYLE]
+    style_id = _resolve_style(style_id)
 
     if max_bytes:
-        size = len(prompt.encode("utf-8"))
+        size = _COMPOSED_PROMPT_BYTES[style_id]
         if size > max_bytes:
             logger.warning(
                 "Style '%s' prompt (%d B) exceeds requested limit (%d B)",
                 style_id, size, max_bytes,
             )
 
-    today = date.today().strftime("%B %d, %Y")
-    return f"Current date: {today}. All responses must be relevant to this date unless the user specifies otherwise.\n\n{prompt}"
+    return _dated_prompt(style_id)[1]
+
+
+def get_system_prompt_size(style_id: str) -> int:
+    """Return the UTF-8 byte size of ``get_system_prompt(style_id)``.
+
+    Served from the same daily cache, so budget checks don't need to
+    build and encode the prompt themselves.
+    """
+    return _dated_prompt(_resolve_style(style_id))[2]
+
+
+def split_cacheable_prefix(system_prompt: str) -> Tuple[str, str]:
+    """Split a system prompt into ``(static style prompt, dynamic rest)``.
+
+    The static part is the composed base + style prompt, identical for
+    every request with that style, so providers with explicit prompt
+    caching can mark it as a cache checkpoint.  The rest holds the date
+    line and any per-request context callers appended.  Returns
+    ``("", system_prompt)`` when no style prompt is a prefix.
+    """
+    for prompt in _COMPOSED_PROMPTS.values():
+        if system_prompt.startswith(prompt):
+            return prompt, system_prompt[len(prompt):].lstrip("\n")
+    return "", system_prompt
 
 
 def get_component_priority(style_id: str) -> List[str]:
@@ -111,6 +181,19 @@ def get_component_priority(style_id: str) -> List[str]:
     return style["component_priority"]
 
 
+def get_component_ranks(style_id: str) -> Dict[str, int]:
+    """Return ``{component type: rank}`` for a style's component priority.
+
+    Precomputed at import so ordering components is a dict lookup per
+    component rather than a ``list.index`` scan.
+    """
+    ranks = _COMPONENT_RANKS.get(style_id)
+    if ranks is None:
+        logger.warning("Unknown style '%s' — falling back to '%s'", style_id, DEFAULT_STYLE)
+        ranks = _COMPONENT_RANKS[DEFAULT_STYLE]
+    return ranks
+
+
 def get_available_styles() -> List[Dict[str, str]]:
     """Return metadata for all registered styles (for API / frontend)."""
     return [
@@ -196,7 +279,22 @@ def classify_style(message: str) -> str:
     Returns a style ID from ``CONTENT_STYLES``.
     """
     msg = message.strip()
+    if len(msg) > _CLASSIFY_CACHE_MAX_CHARS:
+        return _classify_cached.__wrapped__(msg)
+    return _classify_cached(msg)
+
+
+# Only short messages are cached — repeats are chips and quick questions,
+# and this bounds the cache at roughly 2048 × 512 chars.
+_CLASSIFY_CACHE_MAX_CHARS = 512
 
+
+@lru_cache(maxsize=2048)
+def _classify_cached(msg: str) -> str:
+    """Memoized core of :func:`classify_style`, keyed on the stripped message.
+
+    Repeated prompts (suggestion chips, retries) skip the regex entirely.
+    """
     for pattern, style_id in _CLASSIFICATION_RULES:
         if pattern.search(msg):
             return style_id
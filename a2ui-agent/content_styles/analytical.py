@@ -28,7 +28,7 @@ ANALYTICAL STYLE: Data-rich dashboards — KPIs, charts, tables. Visual insight
 
 COMPONENT ORDER (mandatory): alert → stat grid → chart → data-table. Charts ALWAYS before tables.
 
-TEMPORAL: Time-series should use recent trailing months ending at the current date. Never title a chart with an older year. (See RELEVANCE rule above for full temporal/geographic requirements.)
+TEMPORAL: Time-series should use recent trailing months ending at the current date. Never title a chart with an older year.
 
 CONTENT BLEND: "text" = brief markdown summary with **bold** key numbers and `ticker` codes. Components carry the data.
 
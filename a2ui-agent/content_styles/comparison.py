@@ -28,7 +28,7 @@ COMPARISON STYLE: Side-by-side analysis emphasizing differences and similarities
 
 COMPONENT ORDER: alert (if needed) → chart (visual comparison) → data-table (feature breakdown) → list (takeaways).
 
-TEMPORAL: All comparisons must use current-generation products, versions, specs, and pricing. Reference the latest models — never training-data-era model numbers. If uncertain about current specs, use most recent known and note it. (See RELEVANCE rule above for full requirements.)
+TEMPORAL: Compare current-generation products, versions, specs, and pricing. If uncertain about current specs, use most recent known and note it.
 
 CONTENT BLEND: Use "text" for a markdown summary with **bold** key takeaways — give the user the bottom line up front. Radar charts work well for multi-dimensional comparisons. Use data-table for detailed feature-by-feature breakdowns.
 
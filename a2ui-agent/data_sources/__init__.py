@@ -1,9 +1,9 @@
 """
 A2UI Data Sources — registry and public API.
 
-Loads source definitions from ``config.yaml`` at import time and
-provides a typed registry the pipeline uses to discover, query,
-and format external data.
+Loads source definitions from ``config.yaml`` at startup (and again, in
+the background, whenever the file changes) and provides a typed registry
+the pipeline uses to discover, query, and format external data.
 
 Public API:
     get_available_sources()  — list of source dicts for /api/data-sources
@@ -12,14 +12,18 @@ Public API:
     get_analyzer_context()   — compact summary for the AI analyzer prompt
     get_rules_context()      — LLM rules aggregated from all sources
     query_sources(queries)   — execute multiple source queries in parallel
+    iter_query_sources(q)    — same, yielding (index, result) as each finishes
+    load_sources()           — build the registry on startup
+    reload_sources()         — force config.yaml to be re-read
+    close_sources()          — close source clients on shutdown
 """
 
 import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
 
-import yaml
+import orjson
 
 from ._base import DataSource
 
@@ -27,29 +31,40 @@ logger = logging.getLogger(__name__)
 
 # ── Source registry ───────────────────────────────────────────
 
-_SOURCES: Dict[str, DataSource] = {}
 _CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config.yaml")
 
 
-def _load_config() -> None:
-    """Parse config.yaml and instantiate source objects."""
-    global _SOURCES
+def _sources_for(path: str, mtime_ns: int, size: int) -> Dict[str, DataSource]:
+    """Parse the config at *path* and instantiate source objects.
 
-    if not os.path.exists(_CONFIG_PATH):
-        logger.info("No data sources config found at %s", _CONFIG_PATH)
-        return
+    Blocking (YAML parse, OpenAPI spec fetches), so it runs in a worker
+    thread once the server is up.
+    """
+    sources: Dict[str, DataSource] = {}
+
+    if size < 0:
+        logger.info("No data sources config found at %s", path)
+        return sources
 
     try:
-        with open(_CONFIG_PATH) as f:
-            cfg = yaml.safe_load(f) or {}
+        import yaml
+
+        # libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", None)
+        if loader is None:
+            logger.info("libyaml not available — parsing config with pure-Python loader")
+            loader = yaml.SafeLoader
+        with open(path, "rb") as f:
+            raw = f.read()
+        cfg = yaml.load(raw, Loader=loader) or {}
     except Exception as exc:
         logger.warning("Failed to parse data sources config: %s", exc)
-        return
+        return sources
 
     entries = cfg.get("sources") or []
     if not entries:
         logger.info("Data sources config loaded — 0 sources defined")
-        return
+        return sources
 
     for entry in entries:
         src_id = entry.get("id")
@@ -60,7 +75,7 @@ def _load_config() -> None:
 
         try:
             source = _create_source(src_type, entry)
-            _SOURCES[src_id] = source
+            sources[src_id] = source
             logger.info(
                 "Registered data source: %s (%s) available=%s",
                 src_id, src_type, source.is_available(),
@@ -72,9 +87,151 @@ def _load_config() -> None:
 
     logger.info(
         "Data sources loaded: %d total, %d available",
-        len(_SOURCES),
-        sum(1 for s in _SOURCES.values() if s.is_available()),
+        len(sources),
+        sum(1 for s in sources.values() if s.is_available()),
     )
+    return sources
+
+
+def _config_key() -> Tuple[str, int, int]:
+    """Cache key for the current config.yaml: ``(path, mtime_ns, size)``."""
+    try:
+        st = os.stat(_CONFIG_PATH)
+    except FileNotFoundError:
+        return (_CONFIG_PATH, 0, -1)
+    return (_CONFIG_PATH, st.st_mtime_ns, st.st_size)
+
+
+# The registry handed out by _registry(), the config version it was built
+# from and its ``(analyzer_context, rules_context)``.  When config.yaml
+# changes a new registry replaces it, and the old sources' clients are closed.
+_active_sources: Optional[Dict[str, DataSource]] = None
+_active_key: Optional[Tuple[str, int, int]] = None
+_contexts: Tuple[str, str] = ("", "")
+_reload_task: Optional["asyncio.Task[None]"] = None
+# Replaced registries waiting for their queries to finish, keyed by close task
+_retiring: Dict["asyncio.Task[None]", List[DataSource]] = {}
+
+
+def _load(
+    key: Tuple[str, int, int],
+) -> Tuple[Dict[str, DataSource], Tuple[str, str]]:
+    sources = _sources_for(*key)
+    return sources, _build_contexts(sources)
+
+
+def _activate(
+    key: Tuple[str, int, int],
+    sources: Dict[str, DataSource],
+    contexts: Tuple[str, str],
+) -> None:
+    global _active_sources, _active_key, _contexts
+    if _active_sources:
+        _retire_sources(_active_sources)
+    _active_sources, _active_key, _contexts = sources, key, contexts
+
+
+def _registry() -> Dict[str, DataSource]:
+    """Return the current source registry.
+
+    Built by :func:`load_sources` at startup.  When config.yaml changes,
+    the new registry is built in a worker thread and the current one keeps
+    serving until it is ready.
+    """
+    global _reload_task
+    sources = _active_sources
+    key = _config_key()
+    if sources is None or key != _active_key:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or sources is None:
+            # Outside the server, or started without load_sources()
+            sources, contexts = _load(key)
+            _activate(key, sources, contexts)
+        elif _reload_task is None:
+            _reload_task = loop.create_task(_reload(key))
+    return sources
+
+
+async def _reload(key: Tuple[str, int, int]) -> None:
+    global _reload_task
+    try:
+        loaded = await asyncio.to_thread(_load, key)
+    finally:
+        _reload_task = None
+    _activate(key, *loaded)
+    logger.info("Data sources reloaded after config change")
+
+
+async def load_sources() -> None:
+    """Build the registry from config.yaml.  Call on application startup.
+
+    Runs in a worker thread so the YAML parse and any OpenAPI spec fetch
+    stay off the event loop.
+    """
+    key = _config_key()
+    _activate(key, *await asyncio.to_thread(_load, key))
+
+
+def _retire_sources(sources: Dict[str, DataSource]) -> None:
+    """Close a replaced registry's clients once in-flight queries have drained."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running, so no query can be using the clients; they were
+        # created on a loop that has since ended and are simply dropped.
+        return
+    retired = list(sources.values())
+    task = loop.create_task(_close_later(retired))
+    _retiring[task] = retired
+    task.add_done_callback(lambda t: _retiring.pop(t, None))
+
+
+# Queries running (or queued on a semaphore) per source.  A retired source
+# is closed only once its count drops to zero, however long Genie polls.
+_running: Dict[DataSource, int] = {}
+# Lets queries that picked up the old registry just before the swap start
+# (and be counted) before we check whether it is idle.
+_RETIRE_SETTLE_SECONDS = 5
+_RETIRE_POLL_SECONDS = 1
+
+
+async def _close_later(sources: List[DataSource]) -> None:
+    await asyncio.sleep(_RETIRE_SETTLE_SECONDS)
+    while any(_running.get(source) for source in sources):
+        await asyncio.sleep(_RETIRE_POLL_SECONDS)
+    await _close_all(sources)
+
+
+async def _close_all(sources: List[DataSource]) -> None:
+    for source in sources:
+        try:
+            await source.aclose()
+        except Exception as exc:
+            logger.warning("Failed to close data source '%s': %s", source.id, exc)
+
+
+def reload_sources() -> None:
+    """Mark the registry stale so the next access re-reads config.yaml."""
+    global _active_key
+    _active_key = None
+
+
+async def close_sources() -> None:
+    """Close every source's client.  Call on application shutdown."""
+    global _active_sources, _active_key
+    if _reload_task is not None:
+        _reload_task.cancel()
+    sources, _active_sources, _active_key = _active_sources, None, None
+    # Shutting down: close retired registries now instead of once idle
+    to_close = list((sources or {}).values())
+    for task, retired in list(_retiring.items()):
+        task.cancel()
+        to_close.extend(retired)
+    _retiring.clear()
+    await _close_all(to_close)
 
 
 def _create_source(src_type: str, cfg: Dict[str, Any]) -> DataSource:
@@ -89,22 +246,37 @@ def _create_source(src_type: str, cfg: Dict[str, Any]) -> DataSource:
         raise ValueError(f"Unknown data source type: {src_type}")
 
 
+# ── Query concurrency ─────────────────────────────────────────
+
+# Upper bound on data source queries in flight across all sources; each
+# source additionally caps itself at its ``max_concurrency`` (default 4).
+_MAX_CONCURRENT_QUERIES = 16
+_query_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_query_semaphore() -> asyncio.Semaphore:
+    global _query_semaphore
+    if _query_semaphore is None:
+        _query_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_QUERIES)
+    return _query_semaphore
+
+
 # ── Public API ────────────────────────────────────────────────
 
 
 def get_source(source_id: str) -> Optional[DataSource]:
     """Get a specific source by ID."""
-    return _SOURCES.get(source_id)
+    return _registry().get(source_id)
 
 
 def get_all_sources() -> List[DataSource]:
     """Return all loaded sources (regardless of availability)."""
-    return list(_SOURCES.values())
+    return list(_registry().values())
 
 
 def get_available_sources() -> List[Dict[str, Any]]:
     """Serializable list of sources for the /api/data-sources endpoint."""
-    return [s.to_dict() for s in _SOURCES.values()]
+    return [s.to_dict() for s in _registry().values()]
 
 
 def get_analyzer_context() -> str:
@@ -113,14 +285,8 @@ def get_analyzer_context() -> str:
     Returns an empty string if no sources are available (the analyzer
     will skip the data_sources decision entirely).
     """
-    available = [s for s in _SOURCES.values() if s.is_available()]
-    if not available:
-        return ""
-
-    lines = ["Available data sources:"]
-    for s in available:
-        lines.append(s.get_analyzer_summary())
-    return "\n".join(lines)
+    _registry()
+    return _contexts[0]
 
 
 def get_rules_context() -> str:
@@ -129,19 +295,37 @@ def get_rules_context() -> str:
     Injected into the system prompt so the LLM knows HOW and WHEN
     to interpret data from each source.
     """
-    available = [s for s in _SOURCES.values() if s.is_available() and s.rules]
+    _registry()
+    return _contexts[1]
+
+
+def _build_contexts(sources: Dict[str, DataSource]) -> Tuple[str, str]:
+    """Build ``(analyzer_context, rules_context)`` once per registry.
+
+    Source availability is resolved from config and env at construction,
+    so both strings are fixed for the lifetime of a registry.
+    """
+    available = [s for s in sources.values() if s.is_available()]
     if not available:
-        return ""
+        return "", ""
 
-    lines = [
+    analyzer_lines = ["Available data sources:"]
+    for s in available:
+        analyzer_lines.append(s.get_analyzer_summary())
+
+    with_rules = [s for s in available if s.rules]
+    if not with_rules:
+        return "\n".join(analyzer_lines), ""
+
+    rules_lines = [
         "[Data Source Rules]",
         "CRITICAL: The [Data Source: ...] blocks contain REAL data from live API queries.",
         "Use ONLY this data. NEVER supplement with training knowledge, NEVER invent additional records,",
         "and NEVER fill gaps from memory. If the data is empty or has zero values, report that honestly.",
     ]
-    for s in available:
-        lines.append(f"• {s.name}: {s.rules.strip()}")
-    return "\n".join(lines)
+    for s in with_rules:
+        rules_lines.append(f"• {s.name}: {s.rules.strip()}")
+    return "\n".join(analyzer_lines), "\n".join(rules_lines)
 
 
 async def query_sources(
@@ -149,33 +333,117 @@ async def query_sources(
 ) -> List[Dict[str, Any]]:
     """Execute multiple data source queries in parallel.
 
+    Concurrency is bounded globally and per source (``max_concurrency``
+    in config.yaml) so a burst of queries cannot flood a slow backend.
+
     Each query dict should have:
         {"source": "source-id", "endpoint": "/path", "params": {...}}
 
-    Returns a list of result dicts (one per query).
+    Returns a list of result dicts (one per query, in query order).
+    """
+    results: List[Dict[str, Any]] = [{}] * len(queries)
+    async for index, result in iter_query_sources(queries):
+        results[index] = result
+    return results
+
+
+async def iter_query_sources(
+    queries: List[Dict[str, Any]],
+) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+    """Like :func:`query_sources`, but yield ``(index, result)`` as each finishes.
+
+    Results arrive in completion order so callers can use fast sources
+    while slow ones (e.g. Genie) are still polling; ``index`` is the
+    query's position in *queries*.
     """
+    sources = _registry()
     tasks = []
-    for q in queries:
-        source = _SOURCES.get(q.get("source", ""))
+    for i, q in enumerate(queries):
+        source_id = q.get("source")
+        source = sources.get(source_id or "")
         if not source or not source.is_available():
-            tasks.append(_skip_result(q))
+            tasks.append(_indexed(i, _skip_result(source_id or "unknown")))
             continue
-        tasks.append(_execute_query(source, q))
+        tasks.append(_indexed(i, _execute_query(
+            source,
+            q.get("endpoint", ""),
+            q.get("params"),
+            q.get("method", "GET"),
+        )))
+
+    for next_done in asyncio.as_completed(tasks):
+        yield await next_done
+
+
+async def _indexed(
+    index: int,
+    coro: Awaitable[Dict[str, Any]],
+) -> Tuple[int, Dict[str, Any]]:
+    return index, await coro
+
 
-    return await asyncio.gather(*tasks)
+# Single-flight map: identical reads already in flight share one call.
+_INFLIGHT: Dict[Tuple[str, str, str, bytes], "asyncio.Future[Dict[str, Any]]"] = {}
+
+
+def _inflight_key(
+    source_id: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+) -> Optional[Tuple[str, str, str, bytes]]:
+    """``(source, method, endpoint, params)`` key, or None if the call must run alone.
+
+    Only GETs are shared; writes have side effects, so each one goes
+    upstream.  Params that can't be serialized aren't keyed either.
+    """
+    if method.upper() != "GET":
+        return None
+    try:
+        params_key = orjson.dumps(params, option=orjson.OPT_SORT_KEYS) if params else b""
+    except orjson.JSONEncodeError:
+        return None
+    return (source_id, method, endpoint, params_key)
 
 
 async def _execute_query(
     source: DataSource,
-    query: Dict[str, Any],
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
+) -> Dict[str, Any]:
+    """Execute a single source query, sharing the call with identical in-flight queries."""
+    key = _inflight_key(source.id, endpoint, params, method)
+    if key is None:
+        return await _run_query(source, endpoint, params, method)
+
+    pending = _INFLIGHT.get(key)
+    if pending is not None:
+        logger.info("Data source query deduplicated (%s)", source.id)
+        return dict(await asyncio.shield(pending))
+
+    # Shielded so a cancelled caller doesn't cancel it for the others
+    task = asyncio.ensure_future(_run_query(source, endpoint, params, method))
+    _INFLIGHT[key] = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _INFLIGHT.pop(key, None)
+
+
+async def _run_query(
+    source: DataSource,
+    endpoint: str,
+    params: Optional[Dict[str, Any]],
+    method: str,
 ) -> Dict[str, Any]:
     """Execute a single source query with error handling."""
+    _running[source] = _running.get(source, 0) + 1
     try:
-        result = await source.query(
-            endpoint=query.get("endpoint", ""),
-            params=query.get("params"),
-            method=query.get("method", "GET"),
-        )
+        async with source.semaphore, _get_query_semaphore():
+            result = await source.query(
+                endpoint=endpoint, params=params, method=method,
+            )
         result["_source_id"] = source.id
         result["_source_name"] = source.name
         return result
@@ -187,28 +455,30 @@ async def _execute_query(
             "_source_id": source.id,
             "_source_name": source.name,
         }
+    finally:
+        remaining = _running.pop(source) - 1
+        if remaining:
+            _running[source] = remaining
 
 
-async def _skip_result(query: Dict[str, Any]) -> Dict[str, Any]:
+async def _skip_result(source_id: str) -> Dict[str, Any]:
     return {
         "success": False,
         "error": "source_unavailable",
-        "_source_id": query.get("source", "unknown"),
-        "_source_name": query.get("source", "unknown"),
+        "_source_id": source_id,
+        "_source_name": source_id,
     }
 
 
 def format_results_for_context(results: List[Dict[str, Any]]) -> str:
     """Combine multiple source results into a single LLM context block."""
+    sources = _registry()
     blocks: List[str] = []
     for r in results:
-        source = _SOURCES.get(r.get("_source_id", ""))
+        source = sources.get(r.get("_source_id", ""))
         if source and r.get("success"):
             block = source.format_for_context(r, label=r.get("_source_name"))
             if block:
                 blocks.append(block)
     return "\n".join(blocks)
 
-
-# ── Load on import ────────────────────────────────────────────
-_load_config()
@@ -5,8 +5,21 @@ Every connector (REST, Databricks, etc.) implements this interface.
 The registry loads sources from config and exposes them to the pipeline.
 """
 
+import asyncio
+import importlib.util
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+# Context budget for a single source's results.  Large payloads are cut
+# down structurally before serializing so we never encode megabytes of
+# records only to slice the string afterwards.
+_MAX_CONTEXT_CHARS = 12_000
+_MAX_CONTEXT_RECORDS = 200
+_MAX_VALUE_CHARS = 500
 
 
 class DataSource(ABC):
@@ -19,12 +32,22 @@ class DataSource(ABC):
         description: str = "",
         rules: str = "",
         enabled: bool = True,
+        max_concurrency: int = 4,
     ) -> None:
         self.id = id
         self.name = name
         self.description = description
         self.rules = rules
         self.enabled = enabled
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Limit on concurrent queries to this source (created on first use)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
 
     @abstractmethod
     def is_available(self) -> bool:
@@ -85,17 +108,28 @@ class DataSource(ABC):
             return ""
 
         tag = label or self.name
-        import json
         if isinstance(data, (dict, list)):
-            serialized = json.dumps(data, default=str, ensure_ascii=False)
+            # Cheap structural pass first; the payload is encoded once,
+            # untrimmed only when nothing exceeded the caps.
+            data, dropped = _trim(data)
+            serialized = _dumps(data)
             # Truncate very large payloads to keep context reasonable
-            if len(serialized) > 12_000:
-                serialized = serialized[:12_000] + "\n... (truncated)"
+            if len(serialized) > _MAX_CONTEXT_CHARS:
+                serialized = serialized[:_MAX_CONTEXT_CHARS] + "\n... (truncated)"
+            elif dropped:
+                serialized += f"\n... ({dropped} more records)"
         else:
             serialized = str(data)
 
         return f"[Data Source: {tag}]\n{serialized}\n"
 
+    async def aclose(self) -> None:
+        """Release network resources (connection pools) held by the source.
+
+        Override in subclasses that keep a client.  Safe to call more than
+        once; the source recreates its client if queried again.
+        """
+
     def to_dict(self) -> Dict[str, Any]:
         """Serializable representation for the /api/data-sources endpoint."""
         return {
@@ -107,3 +141,51 @@ class DataSource(ABC):
             "has_rules": bool(self.rules),
             "endpoints": self.get_endpoints_summary() or None,
         }
+
+
+def _trim(data: Any) -> Tuple[Any, int]:
+    """Cap record lists and long top-level strings before serializing.
+
+    Returns the (possibly shallow-copied) data and how many records were
+    dropped.  Only the top level and lists directly under a dict are
+    inspected — enough for REST lists and Genie ``data_array`` results.
+    """
+    if isinstance(data, list):
+        if len(data) > _MAX_CONTEXT_RECORDS:
+            return data[:_MAX_CONTEXT_RECORDS], len(data) - _MAX_CONTEXT_RECORDS
+        return data, 0
+
+    dropped = 0
+    trimmed: Optional[Dict[Any, Any]] = None
+    for key, value in data.items():
+        if isinstance(value, list) and len(value) > _MAX_CONTEXT_RECORDS:
+            dropped += len(value) - _MAX_CONTEXT_RECORDS
+            value = value[:_MAX_CONTEXT_RECORDS]
+        elif isinstance(value, str) and len(value) > _MAX_VALUE_CHARS:
+            value = value[:_MAX_VALUE_CHARS] + "…"
+        else:
+            continue
+        if trimmed is None:
+            trimmed = dict(data)
+        trimmed[key] = value
+    return (data if trimmed is None else trimmed), dropped
+
+
+def _dumps(data: Any) -> str:
+    """Serialize with orjson, falling back to stdlib on rejection.
+
+    orjson rejects a few values ``json`` accepts (integers beyond 64 bits,
+    non-string keys it cannot coerce), so those still serialize.
+    """
+    try:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(data, default=str, ensure_ascii=False)
+
+
+@lru_cache(maxsize=1)
+def http2_available() -> bool:
+    """True if ``h2`` is installed, so httpx clients can negotiate HTTP/2."""
+    return importlib.util.find_spec("h2") is not None
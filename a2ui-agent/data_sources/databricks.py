@@ -16,17 +16,24 @@ Config example:
         workspace_url_env: DATABRICKS_WORKSPACE_URL
         token_env: DATABRICKS_TOKEN
         space_id: "your-genie-space-id"
+        # Optional poll tuning (seconds)
+        poll_initial: 0.2
+        poll_max: 2.5
+        poll_deadline: 30
       description: Enterprise data warehouse — customer analytics, KPIs
       rules: Use for deep analytical questions about internal data
 """
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import httpx
+import orjson
 
-from ._base import DataSource
+from ._base import DataSource, http2_available
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +44,16 @@ def _env(key: Optional[str]) -> Optional[str]:
     return os.getenv(key)
 
 
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a delay-seconds ``Retry-After`` header (HTTP-dates are ignored)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
 class DatabricksDataSource(DataSource):
     """Query a Databricks Genie space."""
 
@@ -47,6 +64,7 @@ class DatabricksDataSource(DataSource):
             description=cfg.get("description", ""),
             rules=cfg.get("rules", ""),
             enabled=cfg.get("enabled", True),
+            max_concurrency=cfg.get("max_concurrency", 4),
         )
         conf = cfg.get("config") or {}
         self._workspace_url = (
@@ -55,15 +73,46 @@ class DatabricksDataSource(DataSource):
         ).rstrip("/")
         self._token = _env(conf.get("token_env")) or conf.get("token", "")
         self._space_id = conf.get("space_id", "")
-
-    def is_available(self) -> bool:
-        return bool(
+        self._poll_initial = float(conf.get("poll_initial", 0.2))
+        self._poll_max = float(conf.get("poll_max", 2.5))
+        self._poll_deadline = float(conf.get("poll_deadline", 30))
+        self._client: Optional["httpx.AsyncClient"] = None
+
+        space_url = f"{self._workspace_url}/api/2.0/genie/spaces/{self._space_id}"
+        self._start_url = f"{space_url}/start-conversation"
+        self._conversations_url = f"{space_url}/conversations"
+        self._headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+        }
+        # Config and env are fixed for the source's lifetime
+        self._available = bool(
             self.enabled
             and self._workspace_url
             and self._token
             and self._space_id
         )
 
+    def is_available(self) -> bool:
+        return self._available
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        """Lazily create one client and reuse its connection pool across queries."""
+        if self._client is None:
+            import httpx
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60, connect=5),
+                http2=http2_available(),
+                limits=httpx.Limits(max_keepalive_connections=8),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
     async def query(
         self,
         endpoint: str,
@@ -81,14 +130,8 @@ class DatabricksDataSource(DataSource):
         if not question:
             return {"success": False, "error": "No question provided"}
 
-        url = (
-            f"{self._workspace_url}/api/2.0/genie/spaces"
-            f"/{self._space_id}/start-conversation"
-        )
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
-        }
+        import httpx
+
         body = {"content": question}
 
         logger.info(
@@ -96,50 +139,52 @@ class DatabricksDataSource(DataSource):
             self._space_id, question[:80],
         )
 
+        client = self.client
         try:
-            async with httpx.AsyncClient(timeout=60) as client:
-                resp = await client.post(url, json=body, headers=headers)
+            resp = await client.post(
+                self._start_url, json=body, headers=self._headers,
+            )
+
+            if resp.status_code >= 400:
+                logger.warning(
+                    "Genie returned %d: %s",
+                    resp.status_code, resp.text[:200],
+                )
+                return {
+                    "success": False,
+                    "error": f"HTTP {resp.status_code}",
+                }
 
-                if resp.status_code >= 400:
-                    logger.warning(
-                        "Genie returned %d: %s",
-                        resp.status_code, resp.text[:200],
+            result = orjson.loads(resp.content)
+            conversation_id = result.get("conversation_id", "")
+            message_id = result.get("message_id", "")
+
+            # Poll for completion (Genie is async)
+            if conversation_id and message_id:
+                data = await self._poll_result(
+                    client, conversation_id, message_id,
+                )
+                if data is not None:
+                    record_count = (
+                        len(data) if isinstance(data, list) else 1
+                    )
+                    logger.info(
+                        "── GENIE OK ──  %d records", record_count,
                     )
                     return {
-                        "success": False,
-                        "error": f"HTTP {resp.status_code}",
+                        "success": True,
+                        "data": data,
+                        "record_count": record_count,
+                        "source": self.id,
                     }
 
-                result = resp.json()
-                conversation_id = result.get("conversation_id", "")
-                message_id = result.get("message_id", "")
-
-                # Poll for completion (Genie is async)
-                if conversation_id and message_id:
-                    data = await self._poll_result(
-                        client, headers, conversation_id, message_id,
-                    )
-                    if data is not None:
-                        record_count = (
-                            len(data) if isinstance(data, list) else 1
-                        )
-                        logger.info(
-                            "── GENIE OK ──  %d records", record_count,
-                        )
-                        return {
-                            "success": True,
-                            "data": data,
-                            "record_count": record_count,
-                            "source": self.id,
-                        }
-
-                # Fallback: return the raw response
-                return {
-                    "success": True,
-                    "data": result,
-                    "record_count": 1,
-                    "source": self.id,
-                }
+            # Fallback: return the raw response
+            return {
+                "success": True,
+                "data": result,
+                "record_count": 1,
+                "source": self.id,
+            }
 
         except httpx.TimeoutException:
             logger.warning("Genie timed out for '%s'", self.id)
@@ -150,28 +195,40 @@ class DatabricksDataSource(DataSource):
 
     async def _poll_result(
         self,
-        client: httpx.AsyncClient,
-        headers: Dict[str, str],
+        client: "httpx.AsyncClient",
         conversation_id: str,
         message_id: str,
-        max_polls: int = 15,
     ) -> Optional[Any]:
-        """Poll Genie for a completed result."""
+        """Poll Genie for a completed result.
+
+        Backs off exponentially from ``poll_initial`` up to ``poll_max``
+        seconds between polls, giving up after ``poll_deadline`` seconds.
+        A ``Retry-After`` header on an error response overrides the delay.
+        """
         import asyncio
 
         poll_url = (
-            f"{self._workspace_url}/api/2.0/genie/spaces"
-            f"/{self._space_id}/conversations/{conversation_id}"
-            f"/messages/{message_id}"
+            f"{self._conversations_url}/{conversation_id}/messages/{message_id}"
         )
+        headers = self._headers
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._poll_deadline
+        delay = self._poll_initial
+        polls = 0
 
-        for i in range(max_polls):
-            await asyncio.sleep(2)
+        while loop.time() + delay < deadline:
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, self._poll_max)
+            polls += 1
             resp = await client.get(poll_url, headers=headers)
             if resp.status_code != 200:
+                retry_after = _retry_after(resp.headers.get("retry-after"))
+                if retry_after is not None:
+                    delay = retry_after
                 continue
 
-            msg = resp.json()
+            msg = orjson.loads(resp.content)
             status = msg.get("status", "")
 
             if status == "COMPLETED":
@@ -187,7 +244,10 @@ class DatabricksDataSource(DataSource):
                 logger.warning("Genie message %s: %s", status, msg.get("error", ""))
                 return None
 
-        logger.warning("Genie poll exhausted after %d attempts", max_polls)
+        logger.warning(
+            "Genie poll exhausted after %d attempts (%.0fs)",
+            polls, self._poll_deadline,
+        )
         return None
 
     def get_endpoints_summary(self) -> str:
@@ -10,14 +10,21 @@ Supports:
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import unquote
 
 import httpx
+import orjson
 
-from ._base import DataSource
+from ._base import DataSource, http2_available
 
 logger = logging.getLogger(__name__)
 
+# Characters that would let a whitelisted path smuggle a query string,
+# fragment, matrix params or an encoded traversal past the matcher.
+_UNSAFE_PATH_CHARS = ("?", "#", ";", "%")
+
 
 class _Endpoint:
     """Parsed endpoint metadata."""
@@ -45,6 +52,48 @@ class _Endpoint:
         return "\n".join(parts)
 
 
+class _PathTrie:
+    """Segment trie for templated paths like ``/users/{id}``.
+
+    ``{…}`` segments match any single non-empty segment; at each step a
+    literal match is tried before the wildcard.
+    """
+
+    __slots__ = ("children", "wildcard", "methods")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_PathTrie"] = {}
+        self.wildcard: Optional["_PathTrie"] = None
+        self.methods: Optional[FrozenSet[str]] = None
+
+    def insert(self, path: str, methods: FrozenSet[str]) -> None:
+        node = self
+        for seg in path.split("/"):
+            if seg.startswith("{") and seg.endswith("}"):
+                if node.wildcard is None:
+                    node.wildcard = _PathTrie()
+                node = node.wildcard
+            else:
+                node = node.children.setdefault(seg, _PathTrie())
+        node.methods = methods if node.methods is None else node.methods | methods
+
+    def match(self, path: str) -> Optional[FrozenSet[str]]:
+        return self._match(path.split("/"), 0)
+
+    def _match(self, segs: List[str], i: int) -> Optional[FrozenSet[str]]:
+        if i == len(segs):
+            return self.methods
+        seg = segs[i]
+        child = self.children.get(seg)
+        if child is not None:
+            found = child._match(segs, i + 1)
+            if found is not None:
+                return found
+        if self.wildcard is not None and seg:
+            return self.wildcard._match(segs, i + 1)
+        return None
+
+
 def _resolve_env(val: Optional[str]) -> Optional[str]:
     """If *val* looks like an env-var name, resolve it; else return as-is."""
     if val and val.endswith("_ENV"):
@@ -54,6 +103,62 @@ def _resolve_env(val: Optional[str]) -> Optional[str]:
     return val
 
 
+# ``(path, METHOD, description, params)`` — one spec endpoint, immutable so
+# parsed specs can be shared between sources.
+_SpecEndpoint = Tuple[str, str, str, Tuple[str, ...]]
+
+
+def _parse_spec(raw: bytes) -> Any:
+    import yaml
+
+    # libyaml's C loader is ~10x faster on large specs
+    return yaml.load(raw, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _spec_endpoints(spec: Any) -> Tuple[_SpecEndpoint, ...]:
+    """Extract endpoint records from a parsed OpenAPI / Swagger document."""
+    if not spec:
+        return ()
+
+    records: List[_SpecEndpoint] = []
+    paths = spec.get("paths") or {}
+    for route, methods in paths.items():
+        for method, detail in methods.items():
+            if method.lower() not in ("get", "post", "put", "patch", "delete"):
+                continue
+            params = tuple(
+                p.get("name", "")
+                for p in (detail.get("parameters") or [])
+                if p.get("in") in ("query", "path")
+            )
+            records.append((
+                route,
+                method.upper(),
+                (detail.get("summary") or detail.get("description") or "")[:120],
+                params,
+            ))
+    return tuple(records)
+
+
+@lru_cache(maxsize=32)
+def _load_spec_file(
+    resolved: str,
+    mtime_ns: int,
+    size: int,
+) -> Optional[Tuple[_SpecEndpoint, ...]]:
+    """Parse a spec file once per version, shared by every source using it.
+
+    Returns None (and logs) if the file can't be read or parsed.
+    """
+    try:
+        with open(resolved, "rb") as f:
+            spec = _parse_spec(f.read())
+    except Exception as exc:
+        logger.warning("Failed to load OpenAPI spec '%s': %s", resolved, exc)
+        return None
+    return _spec_endpoints(spec)
+
+
 class RESTDataSource(DataSource):
     """Connect to any REST API.
 
@@ -85,30 +190,58 @@ class RESTDataSource(DataSource):
             description=cfg.get("description", ""),
             rules=cfg.get("rules", ""),
             enabled=cfg.get("enabled", True),
+            max_concurrency=cfg.get("max_concurrency", 4),
         )
         self.base_url = (cfg.get("base_url") or "").rstrip("/")
         self._endpoints: List[_Endpoint] = []
+        self._endpoint_keys: Set[Tuple[str, str]] = set()
+        self._client: Optional[httpx.AsyncClient] = None
 
         # Auth
         auth = cfg.get("auth") or {}
         self._auth_type = auth.get("type", "none")
         self._auth_token = _resolve_env(auth.get("token_env") or auth.get("token"))
         self._auth_header = auth.get("header", "Authorization")
+        # Auth config is fixed, so every request shares one header dict
+        self._headers = {**self._auth_headers(), "Accept": "application/json"}
+        # Config and env are fixed for the source's lifetime
+        self._available = bool(
+            self.enabled
+            and self.base_url
+            and (self._auth_type == "none" or self._auth_token)
+        )
 
         # Parse manually defined endpoints
         for ep in cfg.get("endpoints") or []:
-            self._endpoints.append(_Endpoint(
+            endpoint = _Endpoint(
                 path=ep["path"],
                 method=ep.get("method", "GET"),
                 description=ep.get("description", ""),
                 params=ep.get("params", []),
-            ))
+            )
+            self._endpoints.append(endpoint)
+            self._endpoint_keys.add((endpoint.path, endpoint.method))
 
         # Parse OpenAPI spec (file path or URL resolved at init)
         spec_path = cfg.get("openapi_spec")
         if spec_path:
             self._load_openapi_spec(spec_path)
 
+        # Whitelist: normalized path -> allowed methods
+        allowed: Dict[str, Set[str]] = {}
+        for ep in self._endpoints:
+            allowed.setdefault(ep.path.rstrip("/"), set()).add(ep.method)
+        self._allowed: Dict[str, FrozenSet[str]] = {
+            path: frozenset(methods) for path, methods in allowed.items()
+        }
+        # Templated paths (``/users/{id}``) are also matched segment-wise
+        self._templates: Optional[_PathTrie] = None
+        for path, methods in self._allowed.items():
+            if "{" in path:
+                if self._templates is None:
+                    self._templates = _PathTrie()
+                self._templates.insert(path, methods)
+
     # ── Auth helpers ──────────────────────────────────────────
 
     def _auth_headers(self) -> Dict[str, str]:
@@ -122,44 +255,39 @@ class RESTDataSource(DataSource):
 
     def _load_openapi_spec(self, path: str) -> None:
         """Parse an OpenAPI 3.x or Swagger 2.x spec into endpoints."""
-        import yaml
-
-        try:
-            if path.startswith("http"):
+        if path.startswith("http"):
+            try:
                 resp = httpx.get(path, timeout=10)
-                spec = yaml.safe_load(resp.text) if resp.status_code == 200 else {}
-            else:
-                resolved = os.path.join(
-                    os.path.dirname(os.path.abspath(__file__)), "..", path
-                )
-                with open(resolved) as f:
-                    spec = yaml.safe_load(f)
-        except Exception as exc:
-            logger.warning("Failed to load OpenAPI spec '%s': %s", path, exc)
-            return
-
-        if not spec:
+                spec = _parse_spec(resp.content) if resp.status_code == 200 else {}
+            except Exception as exc:
+                logger.warning("Failed to load OpenAPI spec '%s': %s", path, exc)
+                return
+            records: Optional[Tuple[_SpecEndpoint, ...]] = _spec_endpoints(spec)
+        else:
+            resolved = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)), "..", path
+            )
+            try:
+                st = os.stat(resolved)
+            except OSError as exc:
+                logger.warning("Failed to load OpenAPI spec '%s': %s", path, exc)
+                return
+            records = _load_spec_file(resolved, st.st_mtime_ns, st.st_size)
+
+        if not records:
             return
 
-        paths = spec.get("paths") or {}
-        for route, methods in paths.items():
-            for method, detail in methods.items():
-                if method.lower() not in ("get", "post", "put", "patch", "delete"):
-                    continue
-                params = [
-                    p.get("name", "")
-                    for p in (detail.get("parameters") or [])
-                    if p.get("in") in ("query", "path")
-                ]
-                ep = _Endpoint(
-                    path=route,
-                    method=method.upper(),
-                    description=(detail.get("summary") or detail.get("description") or "")[:120],
-                    params=params,
-                )
-                # Avoid duplicates from manual + spec overlap
-                if not any(e.path == ep.path and e.method == ep.method for e in self._endpoints):
-                    self._endpoints.append(ep)
+        for route, method, description, params in records:
+            # Avoid duplicates from manual + spec overlap
+            if (route, method) in self._endpoint_keys:
+                continue
+            self._endpoint_keys.add((route, method))
+            self._endpoints.append(_Endpoint(
+                path=route,
+                method=method,
+                description=description,
+                params=list(params),
+            ))
 
         logger.info(
             "Loaded %d endpoints from OpenAPI spec for '%s'",
@@ -169,23 +297,53 @@ class RESTDataSource(DataSource):
     # ── DataSource interface ──────────────────────────────────
 
     def is_available(self) -> bool:
-        if not self.base_url:
-            return False
-        if self._auth_type != "none" and not self._auth_token:
-            return False
-        return self.enabled
+        return self._available
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazily create one client and reuse its connection pool across queries."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30,
+                http2=http2_available(),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     def _is_allowed_endpoint(self, endpoint: str, method: str) -> bool:
-        """Check if the endpoint is in the configured whitelist."""
-        if not self._endpoints:
+        """Check if the endpoint is in the configured whitelist.
+
+        Any whitelisted path may be read with GET; other methods must be
+        listed for that path.  Concrete paths such as ``/users/42`` match
+        templated entries like ``/users/{id}``.  Paths carrying query
+        strings, fragments, matrix params, percent-escapes or ``.``/``..``
+        segments are rejected before matching.
+        """
+        if not self._allowed:
             return True
-        normalized = endpoint.rstrip("/")
-        for ep in self._endpoints:
-            if ep.path.rstrip("/") == normalized and ep.method == method.upper():
-                return True
-            if ep.path.rstrip("/") == normalized and method.upper() == "GET":
-                return True
-        return False
+        decoded = unquote(endpoint)
+        for raw in (endpoint, decoded):
+            if any(ch in raw for ch in _UNSAFE_PATH_CHARS):
+                return False
+        normalized = decoded.rstrip("/")
+        if any(seg in (".", "..") for seg in normalized.split("/")):
+            return False
+        methods = self._allowed.get(normalized)
+        if methods is None and self._templates is not None:
+            methods = self._templates.match(normalized)
+        if methods is None:
+            return False
+        method = method.upper()
+        return method == "GET" or method in methods
 
     async def query(
         self,
@@ -208,50 +366,50 @@ class RESTDataSource(DataSource):
             return {"success": False, "error": "endpoint_not_allowed"}
 
         url = f"{self.base_url}{endpoint}"
-        headers = {**self._auth_headers(), "Accept": "application/json"}
+        headers = self._headers
 
         logger.info(
             "── DATA SOURCE ──  %s %s  params=%s",
             method.upper(), url, params,
         )
 
+        client = self.client
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                if method.upper() == "GET":
-                    resp = await client.get(url, params=params, headers=headers)
-                else:
-                    resp = await client.request(
-                        method.upper(), url, json=params, headers=headers,
-                    )
-
-                if resp.status_code >= 400:
-                    logger.warning(
-                        "Data source '%s' returned %d: %s",
-                        self.id, resp.status_code, resp.text[:200],
-                    )
-                    return {
-                        "success": False,
-                        "error": f"HTTP {resp.status_code}",
-                        "status_code": resp.status_code,
-                    }
-
-                try:
-                    data = resp.json()
-                except Exception:
-                    data = resp.text
-
-                record_count = len(data) if isinstance(data, list) else 1
-                logger.info(
-                    "── DATA SOURCE OK ──  %s  %d records  %d bytes",
-                    self.id, record_count, len(resp.text),
+            if method.upper() == "GET":
+                resp = await client.get(url, params=params, headers=headers)
+            else:
+                resp = await client.request(
+                    method.upper(), url, json=params, headers=headers,
+                )
+
+            if resp.status_code >= 400:
+                logger.warning(
+                    "Data source '%s' returned %d: %s",
+                    self.id, resp.status_code, resp.text[:200],
                 )
                 return {
-                    "success": True,
-                    "data": data,
-                    "record_count": record_count,
-                    "source": self.id,
+                    "success": False,
+                    "error": f"HTTP {resp.status_code}",
+                    "status_code": resp.status_code,
                 }
 
+            try:
+                data = orjson.loads(resp.content)
+            except orjson.JSONDecodeError:
+                data = resp.text
+
+            record_count = len(data) if isinstance(data, list) else 1
+            logger.info(
+                "── DATA SOURCE OK ──  %s  %d records  %d bytes",
+                self.id, record_count, len(resp.content),
+            )
+            return {
+                "success": True,
+                "data": data,
+                "record_count": record_count,
+                "source": self.id,
+            }
+
         except httpx.TimeoutException:
             logger.warning("Data source '%s' timed out", self.id)
             return {"success": False, "error": "timeout"}
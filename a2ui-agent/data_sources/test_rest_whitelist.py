@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+REST Endpoint Whitelist — Bypass Check Script
+
+Run from the a2ui-agent directory (no server needed):
+    python3 data_sources/test_rest_whitelist.py
+
+Checks that templated whitelist entries like ``/users/{id}`` can't be
+matched by encoded traversal, query strings, fragments or matrix params.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_sources.rest import RESTDataSource  # noqa: E402
+
+GREEN = "\033[92m"
+RED = "\033[91m"
+BOLD = "\033[1m"
+CYAN = "\033[96m"
+RESET = "\033[0m"
+
+ALLOWED = [
+    ("GET", "/users"),
+    ("GET", "/users/"),
+    ("GET", "/users/42"),
+    ("GET", "/users/42/roles"),
+    ("POST", "/users/42/roles"),
+]
+
+BLOCKED = [
+    ("POST", "/users/42"),
+    ("GET", "/users/%2e%2e"),
+    ("GET", "/users/%2E%2E/admin"),
+    ("GET", "/users/..;"),
+    ("GET", "/users/.."),
+    ("GET", "/users/."),
+    ("GET", "/users/./42"),
+    ("GET", "/users/42?role=admin"),
+    ("GET", "/users/42#frag"),
+    ("GET", "/users/42;x=1"),
+    ("GET", "/users/%2F"),
+    ("GET", "/users/42%3Frole=admin"),
+    ("GET", "/admin"),
+]
+
+
+def heading(text: str) -> None:
+    print(f"\n{BOLD}{CYAN}{'═' * 60}")
+    print(f"  {text}")
+    print(f"{'═' * 60}{RESET}\n")
+
+
+def make_source() -> RESTDataSource:
+    return RESTDataSource({
+        "id": "users",
+        "base_url": "https://api.example.com",
+        "endpoints": [
+            {"path": "/users", "method": "GET"},
+            {"path": "/users/{id}", "method": "GET"},
+            {"path": "/users/{id}/roles", "method": "POST"},
+        ],
+    })
+
+
+def check(source: RESTDataSource, cases, expected: bool) -> int:
+    failures = 0
+    for method, endpoint in cases:
+        allowed = source._is_allowed_endpoint(endpoint, method)
+        if allowed == expected:
+            print(f"  {GREEN}✓ {method} {endpoint}{RESET}")
+        else:
+            failures += 1
+            verdict = "allowed" if allowed else "blocked"
+            print(f"  {RED}✗ {method} {endpoint} — {verdict}{RESET}")
+    return failures
+
+
+def main() -> None:
+    source = make_source()
+
+    heading("Whitelisted paths are allowed")
+    failures = check(source, ALLOWED, True)
+
+    heading("Bypass strings are blocked")
+    failures += check(source, BLOCKED, False)
+
+    if failures:
+        heading(f"{failures} check(s) failed ✗")
+        sys.exit(1)
+    heading("All Checks Passed ✓")
+
+
+if __name__ == "__main__":
+    main()
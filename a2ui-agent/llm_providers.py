@@ -17,19 +17,23 @@ import os
 import re
 import uuid
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import time
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 import openai
 import anthropic
+import orjson
 
 from content_styles import (
     CONTENT_STYLES,
     DEFAULT_STYLE,
     STYLE_DESCRIPTIONS,
     VALID_STYLE_IDS,
-    get_component_priority,
+    get_component_ranks,
     get_system_prompt,
+    get_system_prompt_size,
+    split_cacheable_prefix,
 )
 
 logger = logging.getLogger(__name__)
@@ -291,14 +295,15 @@ def _error_response(title: str, description: str, variant: str = "error") -> Dic
 
 def _enforce_visual_hierarchy(
     result: Dict[str, Any],
-    priority: Optional[List[str]] = None,
+    ranks: Optional[Dict[str, int]] = None,
 ) -> Dict[str, Any]:
     """Reorder A2UI components according to a style's component priority.
 
-    ``priority`` is an ordered list of component type names (position = rank).
-    Types not in the list are placed at the end.
+    ``ranks`` maps component type names to their priority position
+    (see :func:`content_styles.get_component_ranks`).  Types not in the
+    map are placed at the end.
     """
-    if priority is None:
+    if ranks is None:
         return result
 
     a2ui = result.get("a2ui")
@@ -314,12 +319,13 @@ def _enforce_visual_hierarchy(
     if len(dict_components) < 2:
         return result
 
+    unranked = len(ranks)
+
     def _rank(component: Dict[str, Any]) -> int:
         ctype = component.get("type", "")
-        try:
-            return priority.index(ctype)
-        except ValueError:
-            return len(priority)
+        if not isinstance(ctype, str):
+            return unranked
+        return ranks.get(ctype, unranked)
 
     # Stable sort by priority — preserves relative order within same type
     original_order = [c.get("type") for c in dict_components]
@@ -333,6 +339,19 @@ def _enforce_visual_hierarchy(
     return result
 
 
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson, falling back to stdlib on rejection.
+
+    orjson is stricter than ``json`` (no NaN/Infinity, 64-bit integers
+    only), so anything it refuses is retried with the stdlib parser.
+    Both raise ``json.JSONDecodeError`` subclasses on invalid input.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
 def parse_llm_json(content: str) -> Dict[str, Any]:
     """
     Parse JSON from an LLM response string.
@@ -354,7 +373,7 @@ def parse_llm_json(content: str) -> Dict[str, Any]:
 
     # Try direct parse first (fastest path for clean JSON)
     try:
-        result = json.loads(content)
+        result = _json_loads(content)
         if isinstance(result, dict):
             return result
     except json.JSONDecodeError:
@@ -365,7 +384,7 @@ def parse_llm_json(content: str) -> Dict[str, Any]:
     json_str = _extract_json_object(content)
     if json_str:
         try:
-            result = json.loads(json_str)
+            result = _json_loads(json_str)
             if isinstance(result, dict):
                 return result
         except json.JSONDecodeError as exc:
@@ -375,7 +394,7 @@ def parse_llm_json(content: str) -> Dict[str, Any]:
     match = re.search(r"\{[\s\S]*\}", content)
     if match:
         try:
-            result = json.loads(match.group())
+            result = _json_loads(match.group())
             if isinstance(result, dict):
                 return result
         except json.JSONDecodeError:
@@ -1269,6 +1288,25 @@ class AnthropicProvider(LLMProvider):
             )
         return self._client
 
+    @staticmethod
+    def _system_blocks(system_prompt: str) -> List[Dict[str, Any]]:
+        """System prompt as content blocks with a prompt-cache checkpoint.
+
+        The style prompt (base rules + style body) is the same for every
+        request with that style, so it is marked ``cache_control`` and
+        Anthropic serves it from the prompt cache.  Per-request context
+        appended after it goes in a separate, uncached block.
+        """
+        static, dynamic = split_cacheable_prefix(system_prompt)
+        if not static:
+            return [{"type": "text", "text": system_prompt}]
+        blocks: List[Dict[str, Any]] = [
+            {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}},
+        ]
+        if dynamic:
+            blocks.append({"type": "text", "text": dynamic})
+        return blocks
+
     # Models that support adaptive thinking (type: "adaptive" + effort)
     _ADAPTIVE_MODELS = frozenset({"claude-opus-4-6", "claude-sonnet-4-6"})
     # Sonnet 4.6 also supports manual extended thinking; adaptive is preferred
@@ -1304,7 +1342,7 @@ class AnthropicProvider(LLMProvider):
         kwargs: Dict[str, Any] = dict(
             model=model,
             max_tokens=16000 if model in self._THINKING_MODELS and effort else 4000,
-            system=system_prompt,
+            system=self._system_blocks(system_prompt),
             messages=messages,
             **({"temperature": effective_temp} if effective_temp is not None else {}),
         )
@@ -1377,7 +1415,7 @@ class AnthropicProvider(LLMProvider):
         kwargs: Dict[str, Any] = dict(
             model=model,
             max_tokens=4000,
-            system=system_prompt,
+            system=self._system_blocks(system_prompt),
             messages=messages,
             **({"temperature": effective_temp} if effective_temp is not None else {}),
         )
@@ -1629,6 +1667,19 @@ _ANALYZER_MODELS_FAST: List[tuple] = [
 ]
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+@lru_cache(maxsize=512)
+def _description_words(description: str) -> frozenset:
+    """Lower-cased word set of an endpoint description.
+
+    Endpoint descriptions are static config, so each is tokenized once
+    rather than on every fallback scan.
+    """
+    return frozenset(_WORD_RE.findall(description.lower()))
+
+
 def _fallback_data_sources(message: str) -> List[Dict[str, Any]]:
     """Keyword-based data source matching — safety net when the AI router fails.
 
@@ -1647,7 +1698,7 @@ def _fallback_data_sources(message: str) -> List[Dict[str, Any]]:
     from data_sources.rest import RESTDataSource
 
     query_lower = message.lower()
-    query_words = set(re.findall(r'\w+', query_lower))
+    query_words = set(_WORD_RE.findall(query_lower))
     results: List[Dict[str, Any]] = []
 
     genie_mentioned = "genie" in query_lower
@@ -1660,8 +1711,8 @@ def _fallback_data_sources(message: str) -> List[Dict[str, Any]]:
         best_score = 0
 
         for ep in source._endpoints:
-            desc_words = set(re.findall(r'\w+', (ep.description or "").lower()))
-            param_words = set(p.lower() for p in (ep.params or []))
+            desc_words = _description_words(ep.description or "")
+            param_words = {p.lower() for p in (ep.params or [])}
             score = len(query_words & (desc_words | param_words))
 
             if genie_mentioned and "genie" in ep.path.lower():
@@ -1795,6 +1846,14 @@ _COMPLEXITY_REQUIREMENTS: Dict[str, Dict[str, Any]] = {
     "reasoning": {"min_tier": 3, "tags": {"reasoning"}},
 }
 
+# Complexity → thinking effort passed to providers that support it
+_COMPLEXITY_TO_EFFORT: Dict[str, Optional[str]] = {
+    "standard": None,
+    "moderate": "medium",
+    "high": "high",
+    "reasoning": "high",
+}
+
 _COMPLEX_COMPONENTS = frozenset({
     "chart_matrix", "chart_treemap", "chart_sankey",
     "chart_funnel",
@@ -1918,6 +1977,24 @@ def _find_faster_model(
     return (best["provider"], best["model"])
 
 
+# Human-readable style labels for the analyzer step's reasoning text
+_STYLE_LABELS: Dict[str, str] = {
+    "analytical": "Analytical (data dashboards)",
+    "content": "Content (narrative)",
+    "comparison": "Comparison (side-by-side)",
+    "dashboard": "Dashboard (KPI cards & charts)",
+    "howto": "How-To (step-by-step)",
+    "quick": "Quick Answer (concise)",
+}
+
+# Grounding instruction placed between data-source context and the user
+# message; shared by the passive (frontend-supplied) and active paths.
+_LIVE_DATA_INSTRUCTION = (
+    "[INSTRUCTION: The data above comes from live API queries. Use ONLY this data. "
+    "Do NOT supplement with training knowledge or fabricate additional records.]"
+)
+
+
 # ── Service Layer ──────────────────────────────────────────────
 
 
@@ -2074,7 +2151,7 @@ class LLMService:
                     text = re.sub(r"^```(?:json)?\s*", "", text)
                     text = re.sub(r"\s*```$", "", text)
 
-                result = json.loads(text)
+                result = _json_loads(text)
 
                 style = result.get("style", "").lower().strip()
                 if style not in VALID_STYLE_IDS:
@@ -2187,7 +2264,7 @@ class LLMService:
                     text = re.sub(r"^```(?:json)?\s*", "", text)
                     text = re.sub(r"\s*```$", "", text)
 
-                result = json.loads(text)
+                result = _json_loads(text)
 
                 ds_queries = result.get("data_sources") or []
                 if not isinstance(ds_queries, list):
@@ -2358,24 +2435,16 @@ class LLMService:
                 logger.info("Optimized mode -> downgrading %s -> quick", style_id)
                 style_id = "quick"
             elif performance_mode == "auto" and max_body_bytes is not None:
-                style_bytes = len(get_system_prompt(style_id).encode("utf-8"))
+                style_bytes = get_system_prompt_size(style_id)
                 if style_bytes > max_body_bytes * 0.75:
                     for fallback in ("content", "quick"):
-                        fb_bytes = len(get_system_prompt(fallback).encode("utf-8"))
+                        fb_bytes = get_system_prompt_size(fallback)
                         if fb_bytes <= max_body_bytes * 0.75:
                             logger.info("Budget-aware downgrade: %s -> %s", style_id, fallback)
                             style_id = fallback
                             break
 
-        _style_names = {
-            "analytical": "Analytical (data dashboards)",
-            "content": "Content (narrative)",
-            "comparison": "Comparison (side-by-side)",
-            "dashboard": "Dashboard (KPI cards & charts)",
-            "howto": "How-To (step-by-step)",
-            "quick": "Quick Answer (concise)",
-        }
-        _reasoning_parts = [f"Presentation: {_style_names.get(style_id, style_id)}"]
+        _reasoning_parts = [f"Presentation: {_STYLE_LABELS.get(style_id, style_id)}"]
         if do_search:
             _reasoning_parts.append(f"Web search needed — query: \"{ai_search_query[:80]}\"")
         else:
@@ -2503,10 +2572,6 @@ class LLMService:
                             serialized = serialized[:12_000] + "\n... (truncated)"
                         passive_blocks.append(f"[Data Source: {label}]\n{serialized}")
                     ctx = "\n".join(passive_blocks)
-                    ctx += (
-                        "\n\n[INSTRUCTION: The data above comes from live API queries. Use ONLY this data. "
-                        "Do NOT supplement with training knowledge or fabricate additional records.]"
-                    )
                     return ctx, {"passive": True, "sources": len(data_context)}, []
 
                 if ai_data_queries and data_sources_allowed:
@@ -2571,10 +2636,7 @@ class LLMService:
                 ds_context, ds_metadata, ds_active_results = ds_result
                 if ds_context:
                     augmented_message = (
-                        f"{ds_context}\n\n"
-                        "[INSTRUCTION: The data above comes from live API queries. Use ONLY this data. "
-                        "Do NOT supplement with training knowledge or fabricate additional records.]\n\n"
-                        f"{augmented_message}"
+                        f"{ds_context}\n\n{_LIVE_DATA_INSTRUCTION}\n\n{augmented_message}"
                     )
                 if ai_data_queries and data_sources_allowed:
                     successful_count = ds_metadata.get("successful", 0) if ds_metadata else 0
@@ -2607,8 +2669,9 @@ class LLMService:
 
         # ── Step 3b: Style prompt setup ───────────────────────
         system_prompt = get_system_prompt(style_id)
-        component_priority = get_component_priority(style_id)
-        logger.info("-- STYLE --  %s  |  prompt=%dB", style_id, len(system_prompt.encode("utf-8")))
+        component_ranks = get_component_ranks(style_id)
+        prompt_bytes = get_system_prompt_size(style_id)
+        logger.info("-- STYLE --  %s  |  prompt=%dB", style_id, prompt_bytes)
 
         # ── Step 3c: Micro-context assembly ────────────────────
         from micro_contexts import assemble as assemble_micro_contexts, AVAILABLE_KEYS
@@ -2620,10 +2683,10 @@ class LLMService:
                 micro_block = assemble_micro_contexts(valid_hints, max_bytes=micro_budget)
                 if micro_block:
                     system_prompt = f"{system_prompt}\n\n{micro_block}"
+                    prompt_bytes += 2 + len(micro_block.encode("utf-8"))
                     logger.info("-- MICRO-CONTEXT --  injected %d fragments: %s", len(valid_hints), valid_hints)
 
         if max_body_bytes is not None and performance_mode == "auto":
-            prompt_bytes = len(system_prompt.encode("utf-8"))
             if prompt_bytes > max_body_bytes * _AUTO_DEGRADE_THRESHOLD:
                 max_body_bytes = max(max_body_bytes, prompt_bytes + 1500)
 
@@ -2691,12 +2754,6 @@ class LLMService:
                         }}
 
         # ── Step 4: LLM generation (with token streaming) ─────
-        _COMPLEXITY_TO_EFFORT = {
-            "standard": None,
-            "moderate": "medium",
-            "high": "high",
-            "reasoning": "high",
-        }
         thinking_effort = _COMPLEXITY_TO_EFFORT.get(effective_complexity) if smart_routing and performance_mode in ("auto", "comprehensive") else None
 
         yield {"event": "step", "data": {
@@ -2714,17 +2771,17 @@ class LLMService:
 
         # Try streaming first, fall back to non-streaming on error
         try:
-            full_content = ""
+            content_parts: List[str] = []
             async for delta in effective_provider.generate_stream_tokens(
                 augmented_message, effective_model, effective_history,
                 system_prompt=system_prompt, effort=thinking_effort,
                 temperature=temperature,
             ):
-                full_content += delta
+                content_parts.append(delta)
                 yield {"event": "token", "data": {"delta": delta}}
 
             llm_elapsed = time.time() - llm_t0
-            response = parse_llm_json(full_content)
+            response = parse_llm_json("".join(content_parts))
         except LLMStreamError as stream_err:
             llm_elapsed = time.time() - llm_t0
             logger.warning("Stream error after %.1fs — using error response", llm_elapsed)
@@ -2795,7 +2852,7 @@ class LLMService:
         response = _normalize_a2ui_components(response)
         response = _apply_chart_hints(response, ds_active_results)
         response = _normalize_suggestions(response)
-        response = _enforce_visual_hierarchy(response, component_priority)
+        response = _enforce_visual_hierarchy(response, component_ranks)
 
         if search_metadata:
             response["_search"] = search_metadata
@@ -8,6 +8,7 @@ Provides tool integrations for enhanced AI capabilities:
 
 import logging
 import os
+import re
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -18,10 +19,19 @@ class WebSearchTool:
     
     def __init__(self):
         self.api_key = os.getenv("TAVILY_API_KEY")
+        self._client = None
     
     def is_available(self) -> bool:
         """Check if Tavily API key is configured."""
         return bool(self.api_key)
+
+    @property
+    def client(self):
+        """Lazily create one async Tavily client and reuse its connection pool."""
+        if self._client is None:
+            from tavily import AsyncTavilyClient
+            self._client = AsyncTavilyClient(api_key=self.api_key)
+        return self._client
     
     async def search(
         self, 
@@ -50,11 +60,7 @@ class WebSearchTool:
             }
         
         try:
-            from tavily import TavilyClient
-            
-            client = TavilyClient(api_key=self.api_key)
-            
-            response = client.search(
+            response = await self.client.search(
                 query=query,
                 max_results=max_results,
                 search_depth=search_depth,
@@ -170,6 +176,22 @@ class WebSearchTool:
 web_search = WebSearchTool()
 
 
+# Shared async client for query rewriting, created on first use so the
+# connection pool and TLS context are reused across requests.  Re-created
+# only if OPENAI_API_KEY changes.
+_rewrite_client: Any = None
+_rewrite_client_key: Optional[str] = None
+
+
+def _get_rewrite_client(api_key: str):
+    global _rewrite_client, _rewrite_client_key
+    if _rewrite_client is None or _rewrite_client_key != api_key:
+        import openai
+        _rewrite_client = openai.AsyncOpenAI(api_key=api_key)
+        _rewrite_client_key = api_key
+    return _rewrite_client
+
+
 async def llm_rewrite_query(
     message: str,
     location: str = "",
@@ -229,10 +251,9 @@ async def llm_rewrite_query(
         user_prompt = f"Recent conversation:\n{context_lines}\nCurrent message: {message}"
 
     try:
-        import openai
-        client = openai.OpenAI(api_key=api_key)
+        client = _get_rewrite_client(api_key)
 
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4.1-nano",
             messages=[
                 {"role": "system", "content": system},
@@ -258,6 +279,24 @@ async def llm_rewrite_query(
         return None
 
 
+# Substring indicators for rewrite_search_query, tested against the
+# lowercased query.
+_LOCAL_INDICATORS = (
+    "weather", "forecast", "temperature", "near me", "nearby",
+    "local", "restaurant", "food", "store", "event", "concert",
+    "traffic", "commute", "directions", "open now",
+)
+
+_TIME_INDICATORS = (
+    "current", "latest", "today", "now", "recent", "this week",
+    "this month", "this year", "trending", "popular", "new",
+    "price", "stock", "dow", "nasdaq", "s&p", "bitcoin",
+    "crypto", "market", "score", "standings", "news",
+)
+
+_WEATHER_INDICATORS = ("weather", "forecast", "temperature")
+
+
 def rewrite_search_query(
     message: str,
     location: str = "",
@@ -275,7 +314,6 @@ def rewrite_search_query(
         "Compare iPhone vs Android"  →  "iPhone vs Android comparison 2026"
         "Show me cool artwork"   →  "trending contemporary artwork 2026"
     """
-    import re
     from datetime import datetime
 
     if not current_date:
@@ -298,26 +336,18 @@ def rewrite_search_query(
     if len(cleaned) < 3:
         cleaned = msg
 
+    # Lowercase once — the indicator scans below would otherwise
+    # re-lowercase the query for every indicator they test.
+    cleaned_lower = cleaned.lower()
+
     # ── 2. Detect if query is local ─────────────────────────
-    local_indicators = [
-        "weather", "forecast", "temperature", "near me", "nearby",
-        "local", "restaurant", "food", "store", "event", "concert",
-        "traffic", "commute", "directions", "open now",
-    ]
-    is_local = any(ind in cleaned.lower() for ind in local_indicators)
+    is_local = any(ind in cleaned_lower for ind in _LOCAL_INDICATORS)
 
     # ── 3. Detect if query is time-sensitive ────────────────
-    time_indicators = [
-        "current", "latest", "today", "now", "recent", "this week",
-        "this month", "this year", "trending", "popular", "new",
-        "price", "stock", "dow", "nasdaq", "s&p", "bitcoin",
-        "crypto", "market", "score", "standings", "news",
-    ]
-    is_time_sensitive = any(ind in cleaned.lower() for ind in time_indicators)
+    is_time_sensitive = any(ind in cleaned_lower for ind in _TIME_INDICATORS)
 
     # ── 3b. Detect if query is weather-specific ───────────
-    weather_indicators = ["weather", "forecast", "temperature"]
-    is_weather = any(ind in cleaned.lower() for ind in weather_indicators)
+    is_weather = any(ind in cleaned_lower for ind in _WEATHER_INDICATORS)
 
     # ── 4. Build optimized query ────────────────────────────
     parts = []
@@ -345,6 +375,42 @@ def rewrite_search_query(
     return query
 
 
+# Substring indicators of real-time information needs, tested against the
+# lowercased message.  Hoisted so ``should_search`` doesn't rebuild the
+# list on every call.
+_SEARCH_INDICATORS = (
+    # Temporal cues
+    "current", "latest", "today", "now", "recent", "right now",
+    "this week", "this month", "this year", "yesterday",
+    "these days", "nowadays", "trending", "popular",
+    "getting noticed", "going viral", "buzzing",
+    # Financial / markets
+    "price", "stock", "market", "trading", "index", "fund",
+    "dow", "djia", "nasdaq", "s&p", "sp500", "s&p500",
+    "nyse", "russell", "ftse", "nikkei", "hang seng",
+    "bitcoin", "btc", "eth", "ethereum", "crypto",
+    "forex", "bond", "treasury", "yield", "earnings",
+    "ipo", "dividend", "market cap",
+    # Ticker patterns — 1-5 uppercase letters common in follow-ups
+    "ticker", "share", "shares",
+    # Real-time data
+    "weather", "forecast", "temperature",
+    "news", "headlines", "breaking",
+    "score", "game", "match", "standings",
+    # Direct questions
+    "what is", "what are", "how much", "who won", "who is",
+    "where is", "when is", "is it",
+    "compare", "vs", "versus",
+    "result", "update", "status",
+    # Visual / discovery — benefit from image search
+    "show me", "pictures of", "photos of", "images of",
+    "what does", "look like", "artwork", "art",
+    "design", "architecture", "fashion",
+    # Year references
+    "2024", "2025", "2026",
+)
+
+
 def should_search(message: str) -> bool:
     """
     Determine if a message would benefit from web search.
@@ -355,37 +421,5 @@ def should_search(message: str) -> bool:
     - Data queries (weather, sports, news, etc.)
     - Direct questions that imply factual lookup
     """
-    search_indicators = [
-        # Temporal cues
-        "current", "latest", "today", "now", "recent", "right now",
-        "this week", "this month", "this year", "yesterday",
-        "these days", "nowadays", "trending", "popular",
-        "getting noticed", "going viral", "buzzing",
-        # Financial / markets
-        "price", "stock", "market", "trading", "index", "fund",
-        "dow", "djia", "nasdaq", "s&p", "sp500", "s&p500",
-        "nyse", "russell", "ftse", "nikkei", "hang seng",
-        "bitcoin", "btc", "eth", "ethereum", "crypto",
-        "forex", "bond", "treasury", "yield", "earnings",
-        "ipo", "dividend", "market cap",
-        # Ticker patterns — 1-5 uppercase letters common in follow-ups
-        "ticker", "share", "shares",
-        # Real-time data
-        "weather", "forecast", "temperature",
-        "news", "headlines", "breaking",
-        "score", "game", "match", "standings",
-        # Direct questions
-        "what is", "what are", "how much", "who won", "who is",
-        "where is", "when is", "is it",
-        "compare", "vs", "versus",
-        "result", "update", "status",
-        # Visual / discovery — benefit from image search
-        "show me", "pictures of", "photos of", "images of",
-        "what does", "look like", "artwork", "art",
-        "design", "architecture", "fashion",
-        # Year references
-        "2024", "2025", "2026",
-    ]
-    
     message_lower = message.lower()
-    return any(indicator in message_lower for indicator in search_indicators)
\ No newline at end of file
+    return any(indicator in message_lower for indicator in _SEARCH_INDICATORS)